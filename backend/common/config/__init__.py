@@ -60,6 +60,8 @@ from .mediamtx import (
     FFMPEG_GOP,
     FFMPEG_SCALE_WIDTH,
     FFMPEG_SCALE_HEIGHT,
+    FFMPEG_HW_SCALE,
+    FFMPEG_LOW_LATENCY,
     build_rtsp_publish_url,
     build_playback_urls,
 )
@@ -110,6 +112,8 @@ __all__ = [
     "FFMPEG_GOP",
     "FFMPEG_SCALE_WIDTH",
     "FFMPEG_SCALE_HEIGHT",
+    "FFMPEG_HW_SCALE",
+    "FFMPEG_LOW_LATENCY",
     "build_rtsp_publish_url",
     "build_playback_urls",
     # Sensor fusion
@@ -34,8 +34,14 @@ FFMPEG_LIBX264_PRESET = get_str("FFMPEG_LIBX264_PRESET", "ultrafast")
 FFMPEG_NVENC_PRESET = get_str("FFMPEG_NVENC_PRESET", "p1")
 FFMPEG_VIDEO_BITRATE = get_str("FFMPEG_VIDEO_BITRATE", "4M")
 FFMPEG_GOP = get_int("FFMPEG_GOP", 15)
+# libx264 -tune zerolatency: no lookahead/B-frames. Disable for non-interactive
+# streams to get better quality per bit at the cost of encoder delay.
+FFMPEG_LOW_LATENCY = get_bool("FFMPEG_LOW_LATENCY", default=True)
 FFMPEG_SCALE_WIDTH = get_int("FFMPEG_SCALE_WIDTH", 0)
 FFMPEG_SCALE_HEIGHT = get_int("FFMPEG_SCALE_HEIGHT", 0)
+# Keep decode + scale on the GPU for hardware encoders (NVENC/VideoToolbox).
+# Requires an FFmpeg build with scale_cuda / scale_vt, so it is opt-in.
+FFMPEG_HW_SCALE = get_bool("FFMPEG_HW_SCALE", default=False)
 
 
 def _with_basic_auth(url: str, user: str, password: str) -> str:
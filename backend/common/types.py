@@ -20,6 +20,19 @@ class Detection(BaseModel):
     class_name: str | None = "boat"
     track_id: int | None = None  # Persistent ID for tracking same boat across frames
 
+    def to_payload(self) -> dict:
+        """Same dict as ``model_dump()``, built directly for per-frame payloads."""
+        return {
+            "x": self.x,
+            "y": self.y,
+            "width": self.width,
+            "height": self.height,
+            "confidence": self.confidence,
+            "class_id": self.class_id,
+            "class_name": self.class_name,
+            "track_id": self.track_id,
+        }
+
 
 class Vessel(BaseModel):
     """
@@ -29,7 +29,8 @@ class DecodeThread:
     - FPS pacing for local files
     - Catchup-skip for wall-clock alignment
     - Reconnection with exponential backoff for remote sources
-    - PTS preference with monotonic fallback
+    - Frame-index timestamps for file sources with valid FPS metadata;
+      otherwise PTS preference with monotonic fallback
     """
 
     def __init__(self, source_url: str, stream_id: str, loop: bool = True):
@@ -44,6 +45,8 @@ class DecodeThread:
         self._decoded_at_ms: float = 0.0
 
         self._fps: float = DEFAULT_FPS
+        # True only when the source reported a plausible FPS (not DEFAULT_FPS).
+        self._fps_from_source: bool = False
         self._width: int = 0
         self._height: int = 0
 
@@ -66,8 +69,10 @@ class DecodeThread:
         fps_raw = cap.get(cv2.CAP_PROP_FPS)
         if not fps_raw or fps_raw <= 1 or fps_raw > 240:
             self._fps = DEFAULT_FPS
+            self._fps_from_source = False
         else:
             self._fps = float(fps_raw)
+            self._fps_from_source = True
         self._width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         self._height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
@@ -121,6 +126,9 @@ class DecodeThread:
     def _reader_loop(self, cap: cv2.VideoCapture) -> None:
         source_fps = self._fps
         allow_catchup_skips = not self._is_live_source
+        # Only trust the frame index as media time when the FPS came from the
+        # source; with the DEFAULT_FPS fallback, keep using PTS.
+        frame_based_ts = not self._is_live_source and self._fps_from_source
         max_catchup_skip = cv_runtime_settings.stream_max_catchup_skip
         max_reconnect_attempts = cv_runtime_settings.stream_max_reconnect_attempts
 
@@ -229,12 +237,17 @@ class DecodeThread:
 
                 frame_idx += 1
 
-                # Prefer source media PTS when available; fallback to monotonic wall-time.
-                ts_source = cap.get(cv2.CAP_PROP_POS_MSEC)
-                if ts_source and ts_source > 0:
-                    ts = float(ts_source)
+                if frame_based_ts:
+                    # File sources decode sequentially at a known rate, so the
+                    # frame index gives the media time without a cap.get call.
+                    ts = frame_idx * 1000.0 / source_fps
                 else:
-                    ts = (time.monotonic() - start_mono) * 1000.0
+                    # Prefer source media PTS when available; fallback to monotonic wall-time.
+                    ts_source = cap.get(cv2.CAP_PROP_POS_MSEC)
+                    if ts_source and ts_source > 0:
+                        ts = float(ts_source)
+                    else:
+                        ts = (time.monotonic() - start_mono) * 1000.0
                 # Keep monotonic non-decreasing timestamps
                 if ts < last_ts_ms:
                     ts = last_ts_ms
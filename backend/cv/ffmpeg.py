@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import subprocess
 import threading
 
@@ -10,7 +11,9 @@ from common.config.mediamtx import (
     FFMPEG_BIN,
     FFMPEG_CODEC,
     FFMPEG_GOP,
+    FFMPEG_HW_SCALE,
     FFMPEG_LIBX264_PRESET,
+    FFMPEG_LOW_LATENCY,
     FFMPEG_NVENC_PRESET,
     FFMPEG_SCALE_HEIGHT,
     FFMPEG_SCALE_WIDTH,
@@ -24,7 +27,56 @@ from cv.utils import is_http_url, is_remote_url
 logger = logging.getLogger(__name__)
 
 
+# Codec is a property of the source, not of the run: cache successful probes
+# per URL as (mtime_ns, codec). Local files carry their mtime so a replaced
+# file is probed again; remote URLs store None. Per-URL locks make concurrent
+# starts of one source share a probe and are dropped once it finishes.
+_probe_cache: dict[str, tuple[int | None, str]] = {}
+_probe_locks: dict[str, threading.Lock] = {}
+_probe_locks_guard = threading.Lock()
+
+
+def _source_mtime(source_url: str) -> int | None:
+    """Return a local source's mtime in ns, or None for remote or missing sources."""
+    if is_remote_url(source_url):
+        return None
+    try:
+        return os.stat(source_url).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cached_codec(source_url: str, mtime: int | None) -> str | None:
+    cached = _probe_cache.get(source_url)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    return None
+
+
 def _probe_video_codec(source_url: str) -> str | None:
+    """Detect the source video codec (e.g. 'h264'), reusing earlier probes of the same source."""
+    mtime = _source_mtime(source_url)
+    cached = _cached_codec(source_url, mtime)
+    if cached is not None:
+        return cached
+    with _probe_locks_guard:
+        lock = _probe_locks.setdefault(source_url, threading.Lock())
+    try:
+        with lock:
+            cached = _cached_codec(source_url, mtime)
+            if cached is not None:
+                return cached
+            codec = _run_ffprobe(source_url)
+            if codec is not None:
+                _probe_cache[source_url] = (mtime, codec)
+            return codec
+    finally:
+        with _probe_locks_guard:
+            if _probe_locks.get(source_url) is lock:
+                del _probe_locks[source_url]
+
+
+def _run_ffprobe(source_url: str) -> str | None:
     """Use ffprobe to detect the source video codec. Returns e.g. 'h264'."""
     ffprobe_bin = FFPROBE_BIN
     try:
@@ -32,6 +84,8 @@ def _probe_video_codec(source_url: str) -> str | None:
             [
                 ffprobe_bin,
                 "-v", "error",
+                "-probesize", "512000",
+                "-analyzeduration", "500000",
                 "-select_streams", "v:0",
                 "-show_entries", "stream=codec_name",
                 "-of", "json",
@@ -84,13 +138,36 @@ def _transcode_args(codec: str) -> list[str]:
             "-g", str(FFMPEG_GOP),
         ]
     keyint_min = max(1, FFMPEG_GOP // 2)
-    return [
-        "-c:v", "libx264",
-        "-preset", FFMPEG_LIBX264_PRESET,
-        "-tune", "zerolatency",
-        "-g", str(FFMPEG_GOP),
-        "-keyint_min", str(keyint_min),
-    ]
+    args = ["-c:v", "libx264", "-preset", FFMPEG_LIBX264_PRESET]
+    if FFMPEG_LOW_LATENCY:
+        args.extend(["-tune", "zerolatency"])
+    args.extend(["-g", str(FFMPEG_GOP), "-keyint_min", str(keyint_min)])
+    return args
+
+
+def _scale_filter(codec: str) -> str:
+    """Return the ``-vf`` scaling filter for *codec*.
+
+    With FFMPEG_HW_SCALE, hardware encoders scale on-device so frames never
+    round-trip through system memory. Everything else uses the CPU scaler.
+    """
+    size = f"{FFMPEG_SCALE_WIDTH}:{FFMPEG_SCALE_HEIGHT}"
+    if FFMPEG_HW_SCALE and codec == "h264_nvenc":
+        return f"scale_cuda={size}"
+    if FFMPEG_HW_SCALE and codec == "h264_videotoolbox":
+        return f"scale_vt={size}"
+    return f"scale={size}:flags=fast_bilinear"
+
+
+def _hwaccel_input_args(codec: str) -> list[str]:
+    """Return input-side hwaccel flags that keep decoded frames on the GPU for *codec*."""
+    if not FFMPEG_HW_SCALE:
+        return []
+    if codec == "h264_nvenc":
+        return ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"]
+    if codec == "h264_videotoolbox":
+        return ["-hwaccel", "videotoolbox", "-hwaccel_output_format", "videotoolbox_vld"]
+    return []
 
 
 class FFmpegDirectPublisher:
@@ -170,20 +247,22 @@ class FFmpegDirectPublisher:
         # Reduce probe overhead for faster startup
         cmd.extend(["-probesize", "512000", "-analyzeduration", "500000"])
 
+        # Optional scaling (only when transcoding)
+        codec = None if use_copy else (transcode_codec or self._codec_candidates[0])
+        scale = codec is not None and FFMPEG_SCALE_WIDTH > 0 and FFMPEG_SCALE_HEIGHT > 0
+        if scale:
+            cmd.extend(_hwaccel_input_args(codec))
+
         cmd.extend(["-i", self.source_url])
 
         # No audio
         cmd.append("-an")
 
-        if use_copy:
+        if codec is None:
             cmd.extend(["-c:v", "copy"])
         else:
-            codec = transcode_codec or self._codec_candidates[0]
-            # Optional scaling (only when transcoding)
-            if FFMPEG_SCALE_WIDTH > 0 and FFMPEG_SCALE_HEIGHT > 0:
-                cmd.extend(
-                    ["-vf", f"scale={FFMPEG_SCALE_WIDTH}:{FFMPEG_SCALE_HEIGHT}:flags=fast_bilinear"]
-                )
+            if scale:
+                cmd.extend(["-vf", _scale_filter(codec)])
             cmd.extend(_transcode_args(codec))
 
         # Output to MediaMTX RTSP with minimal buffering
@@ -224,7 +303,8 @@ class FFmpegDirectPublisher:
         label = "copy" if use_copy else (transcode_codec or "transcode")
         try:
             cmd = self._build_command(use_copy, transcode_codec)
-            logger.info("[%s] FFmpeg command: %s", self.stream_id, " ".join(cmd))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[%s] FFmpeg command: %s", self.stream_id, " ".join(cmd))
             self.process = subprocess.Popen(
                 cmd,
                 stdin=subprocess.DEVNULL,
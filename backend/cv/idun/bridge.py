@@ -153,6 +153,9 @@ class IdunBridge:
         prev_frame_idx: dict[str, int] = {}
         is_paused = True
         ready_sent: set[str] = set()
+        # Fixed-rate schedule: ticks are spaced from when they were due, not
+        # from when the previous send finished, so encode time does not add drift.
+        next_send = loop.time()
 
         while True:
             active_ids = self._noop.get_active_streams()
@@ -165,6 +168,7 @@ class IdunBridge:
                     known_streams.clear()
                     logger.debug("IDUN bridge: sent pause (no viewers)")
                 await asyncio.sleep(1.0)
+                next_send = loop.time()
                 continue
 
             # Detect added/removed streams
@@ -258,8 +262,16 @@ class IdunBridge:
 
             if not sent_any:
                 await asyncio.sleep(0.005)
-            else:
-                await asyncio.sleep(interval)
+                next_send = loop.time()
+                continue
+
+            next_send += interval
+            delay = next_send - loop.time()
+            if delay <= 0:
+                # Running behind: drop the missed ticks rather than sending a burst.
+                next_send = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
 
     async def _receiver_loop(self, websocket: WebSocket) -> None:
         """Receive detection results and heartbeats from IDUN."""
@@ -30,6 +30,10 @@ class InferenceThread:
     4. Publishes results to per-stream Redis channels
     """
 
+    # Smoothing for the reported per-stream inference FPS; batch timing makes
+    # the instantaneous 1/dt value jumpy.
+    FPS_EMA_ALPHA = 0.2
+
     def __init__(self, detector: RTDETRDetector, publisher: DetectionPublisher):
         self._detector = detector
         self._publisher = publisher
@@ -47,6 +51,7 @@ class InferenceThread:
         self._last_processed_idx: dict[str, int] = {}
         self._ready_sent: set[str] = set()
         self._last_inf_time: dict[str, float] = {}
+        self._inf_fps_ema: dict[str, float] = {}
         self._rate_controllers: dict[str, AdaptiveRateController] = {}
         self._batch_cursor: int = 0
 
@@ -92,6 +97,7 @@ class InferenceThread:
             self._ready_sent.discard(stream_id)
             self._active_stream_ids.discard(stream_id)
             self._last_inf_time.pop(stream_id, None)
+            self._inf_fps_ema.pop(stream_id, None)
             self._rate_controllers.pop(stream_id, None)
         self._tracker_registry.remove(stream_id)
 
@@ -121,6 +127,18 @@ class InferenceThread:
         )
         self._ready_sent.add(stream_id)
 
+    def _update_inference_fps(self, stream_id: str, now: float) -> float:
+        """Record an inference at *now* (monotonic) and return the smoothed FPS."""
+        last_time = self._last_inf_time.get(stream_id)
+        self._last_inf_time[stream_id] = now
+        if last_time is None or now <= last_time:
+            return self._inf_fps_ema.get(stream_id, 0.0)
+        sample = 1.0 / (now - last_time)
+        ema = self._inf_fps_ema.get(stream_id)
+        ema = sample if ema is None else ema + self.FPS_EMA_ALPHA * (sample - ema)
+        self._inf_fps_ema[stream_id] = ema
+        return ema
+
     def _snapshot_active_streams(self) -> tuple[list[str], dict[str, DecodeThread]]:
         with self._lock:
             active_ids = sorted(sid for sid in self._active_stream_ids if sid in self._streams)
@@ -221,16 +239,17 @@ class InferenceThread:
 
             now = time.monotonic()
 
-            # 5. Per-stream: track + publish + report to adaptive rate controller
+            # 5. Per-stream: track + report to adaptive rate controller, then
+            #    publish the whole batch in one Redis round trip
             inference_duration_ms = inference_completed_at_ms - inference_started_at_ms
             per_stream_duration_ms = inference_duration_ms / len(batch) if batch else 0.0
 
+            outgoing: list[tuple[str, dict]] = []
+            perf_inputs: list[tuple[float, float, float, int]] = []
             for i, (sid, dt, frame, frame_idx, ts, decoded_at_ms) in enumerate(batch):
                 tracked_detections = self._tracker_registry.update(sid, results_list[i])
 
-                last_time = self._last_inf_time.get(sid, now)
-                inf_fps = 1.0 / (now - last_time) if now > last_time else 0.0
-                self._last_inf_time[sid] = now
+                inf_fps = self._update_inference_fps(sid, now)
 
                 rate_ctrl = self._rate_controllers.get(sid)
                 if rate_ctrl:
@@ -244,24 +263,32 @@ class InferenceThread:
                     )
                 self._last_processed_idx[sid] = frame_idx
 
-                vessels = [{"detection": d.model_dump(), "vessel": None} for d in tracked_detections]
-                published_at_ms = now_epoch_ms()
+                vessels = [{"detection": d.to_payload(), "vessel": None} for d in tracked_detections]
                 payload = {
                     "type": "detections",
                     "frame_index": frame_idx,
                     "timestamp_ms": ts,
-                    "frame_sent_at_ms": published_at_ms,
                     "fps": dt.fps,
                     "inference_fps": round(inf_fps, 1),
                     "vessels": vessels,
-                    "performance": build_detection_performance_payload(
-                        source_fps=dt.fps,
-                        inference_fps=inf_fps,
-                        decoded_at_ms=decoded_at_ms,
-                        inference_started_at_ms=inference_started_at_ms,
-                        inference_completed_at_ms=inference_completed_at_ms,
-                        published_at_ms=published_at_ms,
-                        skip_interval=skip_interval,
-                    ),
                 }
-                self._publisher.publish(sid, payload)
+                outgoing.append((sid, payload))
+                perf_inputs.append((dt.fps, inf_fps, decoded_at_ms, skip_interval))
+
+            # Stamp the send time once, after tracking and payload building,
+            # so frame_sent_at_ms / publish_duration_ms cover the whole batch.
+            published_at_ms = now_epoch_ms()
+            for (_, payload), (source_fps, inf_fps, decoded_at_ms, skip_interval) in zip(
+                outgoing, perf_inputs,
+            ):
+                payload["frame_sent_at_ms"] = published_at_ms
+                payload["performance"] = build_detection_performance_payload(
+                    source_fps=source_fps,
+                    inference_fps=inf_fps,
+                    decoded_at_ms=decoded_at_ms,
+                    inference_started_at_ms=inference_started_at_ms,
+                    inference_completed_at_ms=inference_completed_at_ms,
+                    published_at_ms=published_at_ms,
+                    skip_interval=skip_interval,
+                )
+            self._publisher.publish_many(outgoing)
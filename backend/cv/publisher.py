@@ -12,21 +12,46 @@ from sensor_fusion.service import SensorFusionService
 
 logger = logging.getLogger(__name__)
 
+# Payloads are freshly built plain dicts, so the encoder's circular-reference
+# bookkeeping is pure overhead. Output is identical to json.dumps().
+_encode_payload = json.JSONEncoder(check_circular=False).encode
+
 
 class DetectionPublisher:
     """Publish detection payloads to a per-stream Redis channel."""
 
     def __init__(self):
         self._redis = create_redis_client()
+        self._channels: dict[str, str] = {}
+
+    def _channel(self, stream_id: str) -> str:
+        channel = self._channels.get(stream_id)
+        if channel is None:
+            channel = self._channels[stream_id] = detections_channel(stream_id)
+        return channel
 
     def publish(self, stream_id: str, payload: dict) -> bool:
         try:
-            self._redis.publish(detections_channel(stream_id), json.dumps(payload))
+            self._redis.publish(self._channel(stream_id), _encode_payload(payload))
             return True
         except RedisError as exc:
             logger.warning("Redis publish failed for stream '%s': %s", stream_id, exc)
             return False
 
+    def publish_many(self, messages: list[tuple[str, dict]]) -> bool:
+        """Publish several (stream_id, payload) pairs in one Redis round trip."""
+        if not messages:
+            return True
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for stream_id, payload in messages:
+                pipe.publish(self._channel(stream_id), _encode_payload(payload))
+            pipe.execute()
+            return True
+        except RedisError as exc:
+            logger.warning("Redis pipelined publish failed for %d messages: %s", len(messages), exc)
+            return False
+
     def close(self) -> None:
         try:
             self._redis.close()
@@ -49,7 +74,7 @@ class FusionPublisher(DetectionPublisher):
         super().__init__()  # creates self._redis via DetectionPublisher
         self.fusion_svc = fusion_svc
 
-    def publish(self, stream_id: str, payload: dict) -> bool:
+    def _enrich(self, stream_id: str, payload: dict) -> dict:
         if payload.get("type") == "detections":
             vessels, meta = self.fusion_svc.enrich(
                 stream_id,
@@ -58,8 +83,15 @@ class FusionPublisher(DetectionPublisher):
             )
             if meta is not None:
                 payload = {**payload, "vessels": vessels, "fusion": meta}
+        return payload
+
+    def publish(self, stream_id: str, payload: dict) -> bool:
+        return super().publish(stream_id, self._enrich(stream_id, payload))
 
-        return super().publish(stream_id, payload)
+    def publish_many(self, messages: list[tuple[str, dict]]) -> bool:
+        return super().publish_many(
+            [(stream_id, self._enrich(stream_id, payload)) for stream_id, payload in messages]
+        )
 
 
 # ── Module-level singleton ────────────────────────────────────────────────────
@@ -8,16 +8,18 @@ This pipeline is intentionally separate from the sensor_fusion module.
 from __future__ import annotations
 
 import asyncio
+import csv
+import json
 import logging
 import time
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Iterable, List
 
 from fastapi import WebSocket, WebSocketDisconnect
 
 from ais import service as ais_service
 from common.config import SAMPLE_DURATION, SAMPLE_START_SEC
-from common.types import Detection, DetectedVessel
+from common.types import Detection, DetectedVessel, Vessel
 from storage import s3
 
 logger = logging.getLogger(__name__)
@@ -31,9 +33,27 @@ class MockStreamState:
     start_second: int
     duration: int
     by_second: dict[int, list[dict]]
+    ready_message: str = field(init=False)
+    # second -> encoded detections message; the replay loops over the same
+    # window, so each second is built once per loaded state.
+    messages: dict[int, str] = field(default_factory=dict)
+    # second -> DetectedVessel list served by get_detections, built once and
+    # returned as-is (shared, read-only for callers).
+    vessels: dict[int, list[DetectedVessel]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Same for every connection, so encode it once, as send_json would.
+        self.ready_message = json.dumps(
+            {"type": "ready", "width": self.width, "height": self.height, "fps": self.fps},
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
 
 
 _mock_cache: MockStreamState | None = None
+# mmsi -> (Vessel, model_dump()). The AIS snapshot is loaded once at import,
+# so a lookup never changes for the life of the process.
+_vessel_cache: dict[str, tuple[Vessel | None, dict | None]] = {}
 _mock_start_mono: float = time.monotonic()
 
 
@@ -47,30 +67,40 @@ def reset_sample_timer(profile: str = "mock") -> float:
     return _mock_start_mono
 
 
-def _load_by_second(lines: List[str]) -> dict[int, list[dict]]:
-    """Parse ground-truth fusion CSV lines into a dict keyed by second."""
+def _normalize_mmsi(raw_mmsi: object) -> str:
+    try:
+        return str(int(float(raw_mmsi)))
+    except (TypeError, ValueError):
+        return str(raw_mmsi)
+
+
+def _load_by_second(lines: Iterable[str]) -> dict[int, list[dict]]:
+    """Parse ground-truth fusion CSV lines into a dict keyed by second.
+
+    Rows are immutable once loaded, so the box centre, normalized MMSI and
+    track id are derived here rather than on every replay tick.
+    """
     by_second: dict[int, list[dict]] = {}
-    for line in lines:
-        row = line.strip()
-        if not row:
-            continue
-        parts = [v.strip() for v in row.split(",")]
-        if len(parts) < 7:
+    for row in csv.reader(lines):
+        if len(row) < 7:
             continue
         try:
-            second = int(float(parts[0]))
-            mmsi = parts[1]
-            left, top = float(parts[2]), float(parts[3])
-            width, height = float(parts[4]), float(parts[5])
-            conf = float(parts[6]) if parts[6] else 1.0
+            # float() tolerates surrounding whitespace; only the strings need stripping.
+            second = int(float(row[0]))
+            mmsi = _normalize_mmsi(row[1].strip())
+            left, top = float(row[2]), float(row[3])
+            width, height = float(row[4]), float(row[5])
+            conf_raw = row[6].strip()
+            conf = float(conf_raw) if conf_raw else 1.0
             by_second.setdefault(second, []).append(
                 {
                     "mmsi": mmsi,
-                    "left": left,
-                    "top": top,
+                    "x": left + width / 2,
+                    "y": top + height / 2,
                     "width": width,
                     "height": height,
                     "confidence": conf,
+                    "track_id": int(mmsi) if mmsi.isdigit() else None,
                 }
             )
         except ValueError:
@@ -78,24 +108,43 @@ def _load_by_second(lines: List[str]) -> dict[int, list[dict]]:
     return by_second
 
 
+def _vessel_for(mmsi: str) -> tuple[Vessel | None, dict | None]:
+    cached = _vessel_cache.get(mmsi)
+    if cached is None:
+        vessel = ais_service.build_vessel_from_ais(mmsi)
+        cached = (vessel, vessel.model_dump() if vessel else None)
+        _vessel_cache[mmsi] = cached
+    return cached
+
+
+def _detection_fields(row: dict) -> dict:
+    return {
+        "x": row["x"],
+        "y": row["y"],
+        "width": row["width"],
+        "height": row["height"],
+        "confidence": row["confidence"],
+        "track_id": row["track_id"],
+    }
+
+
 def _build_vessel(row: dict) -> DetectedVessel:
-    raw_mmsi = row.get("mmsi")
-    try:
-        mmsi = str(int(float(raw_mmsi)))
-    except (TypeError, ValueError):
-        mmsi = str(raw_mmsi)
-    vessel = ais_service.build_vessel_from_ais(mmsi)
-    return DetectedVessel(
-        detection=Detection(
-            x=row["left"] + row["width"] / 2,
-            y=row["top"] + row["height"] / 2,
-            width=row["width"],
-            height=row["height"],
-            confidence=row["confidence"],
-            track_id=int(mmsi) if mmsi.isdigit() else None,
-        ),
-        vessel=vessel,
-    )
+    vessel, _ = _vessel_for(row["mmsi"])
+    return DetectedVessel(detection=Detection(**_detection_fields(row)), vessel=vessel)
+
+
+def _vessel_payload(row: dict) -> dict:
+    """Build the wire dict for *row*, matching ``_build_vessel(row).model_dump()``.
+
+    Rows are already typed by ``_load_by_second``, so the detection skips
+    validation (``model_construct`` still fills Detection's defaults) and the
+    cached AIS dump is reused instead of re-dumping the Vessel.
+    """
+    _, vessel_payload = _vessel_for(row["mmsi"])
+    return {
+        "detection": Detection.model_construct(**_detection_fields(row)).to_payload(),
+        "vessel": vessel_payload,
+    }
 
 
 def _load() -> MockStreamState | None:
@@ -147,14 +196,41 @@ def _current_second(state: MockStreamState) -> int | None:
 
 
 def get_detections() -> List[DetectedVessel]:
-    """Return current detected vessels from the mock stream."""
+    """Return current detected vessels from the mock stream.
+
+    The list and its DetectedVessel objects are cached per second and shared
+    between calls; callers must treat them as read-only.
+    """
     state = _get_state()
     if not state:
         return []
     second = _current_second(state)
     if second is None:
         return []
-    return [_build_vessel(row) for row in state.by_second.get(second, [])]
+    vessels = state.vessels.get(second)
+    if vessels is None:
+        vessels = [_build_vessel(row) for row in state.by_second.get(second, [])]
+        state.vessels[second] = vessels
+    return vessels
+
+
+def _detections_message(state: MockStreamState, second: int) -> str:
+    message = state.messages.get(second)
+    if message is None:
+        message = json.dumps(
+            {
+                "type": "detections",
+                "frame_index": int(second * state.fps),
+                "timestamp_ms": second * 1000,
+                "fps": state.fps,
+                "vessels": [_vessel_payload(row) for row in state.by_second.get(second, [])],
+            },
+            # Match starlette's send_json encoding byte-for-byte.
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        state.messages[second] = message
+    return message
 
 
 async def handle_mock_stream_ws(websocket: WebSocket) -> None:
@@ -166,30 +242,13 @@ async def handle_mock_stream_ws(websocket: WebSocket) -> None:
             await websocket.send_json({"type": "error", "message": "Mock stream data not loaded"})
             return
 
-        await websocket.send_json(
-            {"type": "ready", "width": state.width, "height": state.height, "fps": state.fps}
-        )
+        await websocket.send_text(state.ready_message)
 
         last_second = None
         while True:
             second = _current_second(state)
             if second is not None and second != last_second:
-                vessels = [_build_vessel(row) for row in state.by_second.get(second, [])]
-                await websocket.send_json(
-                    {
-                        "type": "detections",
-                        "frame_index": int(second * state.fps),
-                        "timestamp_ms": second * 1000,
-                        "fps": state.fps,
-                        "vessels": [
-                            {
-                                "detection": v.detection.model_dump(),
-                                "vessel": v.vessel.model_dump() if v.vessel else None,
-                            }
-                            for v in vessels
-                        ],
-                    }
-                )
+                await websocket.send_text(_detections_message(state, second))
                 last_second = second
             await asyncio.sleep(0.1)
     except WebSocketDisconnect:
@@ -6,8 +6,8 @@ dict (x_px, y_px) produced by project_ais_to_pixel.  The matcher uses
 those pixel coordinates to find the closest unmatched detection.
 
 Algorithm: greedy nearest-neighbour in pixel space.
-    1. For each AIS record, compute pixel distance to every detection.
-    2. Sort (ais, detection) pairs by distance ascending.
+    1. Compute the AIS × detection pixel distance matrix in one NumPy pass.
+    2. Sort the in-range (ais, detection) pairs by distance ascending.
     3. Greedily assign the closest pair; mark both as used.
     4. Unmatched detections → dict with vessel=None.
     5. AIS records with no detection match → dict with detection=None
@@ -18,9 +18,10 @@ A match is only accepted when the pixel distance is ≤ MAX_MATCH_DISTANCE_PX.
 from __future__ import annotations
 
 import logging
-import math
 from typing import Any
 
+import numpy as np
+
 from common.config import FUSION_MAX_MATCH_PX as MAX_MATCH_DISTANCE_PX
 from common.types import Detection, Vessel
 
@@ -28,11 +29,15 @@ logger = logging.getLogger(__name__)
 
 
 
-def _pixel_distance(det: Detection, proj: dict[str, Any]) -> float:
-    """Euclidean pixel distance between a detection centre and an AIS projection."""
-    dx = det.x - proj["x_px"]
-    dy = det.y - proj["y_px"]
-    return math.hypot(dx, dy)
+def _pixel_distances(dets: list[Detection], projectable: list[dict[str, Any]]) -> np.ndarray:
+    """Euclidean pixel distances, shape (len(projectable), len(dets))."""
+    det_xy = np.array([(d.x, d.y) for d in dets], dtype=np.float64)
+    ais_xy = np.array(
+        [(r["projection"]["x_px"], r["projection"]["y_px"]) for r in projectable],
+        dtype=np.float64,
+    )
+    diff = ais_xy[:, None, :] - det_xy[None, :, :]
+    return np.hypot(diff[..., 0], diff[..., 1])
 
 
 def _record_to_vessel(record: dict[str, Any]) -> Vessel:
@@ -85,36 +90,36 @@ def match_detections_to_ais(
 
     if not projectable or not parsed_dets:
         # No AIS or no detections — return detections unmatched
-        result = [{"detection": d.model_dump(), "vessel": None} for d in parsed_dets]
+        result = [{"detection": d.to_payload(), "vessel": None} for d in parsed_dets]
         if include_unmatched_ais:
             for rec in projectable:
                 result.append({"detection": None, "vessel": _record_to_vessel(rec).model_dump()})
         return result
 
-    # Build all (distance, ais_idx, det_idx) pairs
-    pairs: list[tuple[float, int, int]] = []
-    for ai, rec in enumerate(projectable):
-        proj = rec["projection"]
-        for di, det in enumerate(parsed_dets):
-            dist = _pixel_distance(det, proj)
-            if dist <= max_distance_px:
-                pairs.append((dist, ai, di))
-
-    pairs.sort(key=lambda p: p[0])
+    # In-range (ais_idx, det_idx) pairs, closest first. nonzero() yields
+    # row-major order and the sort is stable, so ties resolve as before.
+    distances = _pixel_distances(parsed_dets, projectable)
+    pair_ais, pair_det = np.nonzero(distances <= max_distance_px)
+    pair_dist = distances[pair_ais, pair_det]
+    order = np.argsort(pair_dist, kind="stable")
 
     matched_ais: set[int] = set()
     matched_det: set[int] = set()
     fused: list[dict[str, Any]] = []
+    max_matches = min(len(projectable), len(parsed_dets))
 
-    for dist, ai, di in pairs:
+    for k in order.tolist():
+        ai = int(pair_ais[k])
+        di = int(pair_det[k])
         if ai in matched_ais or di in matched_det:
             continue
+        dist = float(pair_dist[k])
         matched_ais.add(ai)
         matched_det.add(di)
         vessel = _record_to_vessel(projectable[ai])
         projection = projectable[ai].get("projection") or {}
         fused.append({
-            "detection": parsed_dets[di].model_dump(),
+            "detection": parsed_dets[di].to_payload(),
             "vessel": vessel.model_dump(),
             "fusion": {
                 "match_distance_px": round(dist, 1),
@@ -126,11 +131,13 @@ def match_detections_to_ais(
             "[matcher] Matched MMSI %s to detection at (%.0f,%.0f) dist=%.1fpx",
             vessel.mmsi, parsed_dets[di].x, parsed_dets[di].y, dist,
         )
+        if len(matched_ais) == max_matches:
+            break
 
     # Unmatched detections
     for di, det in enumerate(parsed_dets):
         if di not in matched_det:
-            fused.append({"detection": det.model_dump(), "vessel": None})
+            fused.append({"detection": det.to_payload(), "vessel": None})
 
     # Optionally include unmatched AIS
     if include_unmatched_ais:
@@ -0,0 +1,101 @@
+"""Tests for DecodeThread media timestamps — frame-index vs PTS selection."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+
+from cv import decode_thread
+from cv.config import DEFAULT_FPS
+from cv.decode_thread import DecodeThread
+
+FRAME_COUNT = 5
+# Deliberately not frame_idx * 1000 / fps, so the two strategies are distinguishable.
+PTS_STEP_MS = 7.0
+
+
+class FakeCapture:
+    """Serves FRAME_COUNT frames with fixed FPS metadata and a synthetic PTS."""
+
+    def __init__(self, fps: float):
+        self._fps = fps
+        self._pos = 0
+        self._opened = True
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def get(self, prop: int) -> float:
+        if prop == cv2.CAP_PROP_FPS:
+            return self._fps
+        if prop == cv2.CAP_PROP_POS_MSEC:
+            return self._pos * PTS_STEP_MS
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return 64
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return 48
+        return 0.0
+
+    def grab(self) -> bool:
+        if self._pos >= FRAME_COUNT:
+            return False
+        self._pos += 1
+        return True
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        if not self.grab():
+            return False, None
+        return True, np.zeros((48, 64, 3), dtype=np.uint8)
+
+    def set(self, _prop: int, _value: float) -> bool:
+        return True
+
+    def release(self) -> None:
+        self._opened = False
+
+
+def _decode_all(monkeypatch, source_url: str, fps: float) -> tuple[DecodeThread, list[tuple[int, float]]]:
+    monkeypatch.setattr(decode_thread.cv2, "VideoCapture", lambda *_args: FakeCapture(fps))
+    monkeypatch.setattr(
+        decode_thread,
+        "cv_runtime_settings",
+        SimpleNamespace(stream_max_catchup_skip=0, stream_max_reconnect_attempts=0),
+    )
+    thread = DecodeThread(source_url, "stream-0", loop=False)
+    seen: list[tuple[int, float]] = []
+    # now_epoch_ms is stamped right after each frame's index/timestamp are stored.
+    monkeypatch.setattr(
+        decode_thread,
+        "now_epoch_ms",
+        lambda: seen.append((thread._frame_idx, thread._timestamp_ms)) or 0.0,
+    )
+
+    assert thread.start()
+    thread._thread.join(timeout=2)
+    assert not thread.is_alive
+    assert len(seen) == FRAME_COUNT
+    return thread, seen
+
+
+def test_file_source_with_valid_fps_uses_frame_index(monkeypatch):
+    thread, seen = _decode_all(monkeypatch, "/videos/sample.mp4", fps=100.0)
+
+    assert thread.fps == 100.0
+    for frame_idx, ts in seen:
+        assert ts == pytest.approx(frame_idx * 1000.0 / 100.0)
+
+
+@pytest.mark.parametrize("fps_raw", [0.0, 1.0, 500.0])
+def test_file_source_with_invalid_fps_keeps_pts(monkeypatch, fps_raw):
+    thread, seen = _decode_all(monkeypatch, "/videos/sample.mp4", fps=fps_raw)
+
+    assert thread.fps == DEFAULT_FPS
+    assert [ts for _idx, ts in seen] == [(i + 1) * PTS_STEP_MS for i in range(FRAME_COUNT)]
+
+
+def test_live_source_keeps_pts(monkeypatch):
+    _thread, seen = _decode_all(monkeypatch, "rtsp://camera.local/stream", fps=30.0)
+
+    assert [ts for _idx, ts in seen] == [(i + 1) * PTS_STEP_MS for i in range(FRAME_COUNT)]
@@ -28,6 +28,10 @@ class TestDetectionModel:
         restored = Detection(**d.model_dump())
         assert restored == d
 
+    def test_to_payload_matches_model_dump(self):
+        for d in (_sample_detection(), _sample_detection(track_id=7, class_id=1, class_name="ship")):
+            assert d.to_payload() == d.model_dump()
+
     def test_defaults(self):
         d = _sample_detection()
         assert d.class_name == "boat"
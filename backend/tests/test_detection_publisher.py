@@ -27,6 +27,19 @@ class TestPublishUnit:
             json.dumps(payload),
         )
 
+    def test_encoding_matches_json_dumps(self):
+        mock_redis = MagicMock()
+        with patch("cv.publisher.create_redis_client", return_value=mock_redis):
+            from cv.publisher import DetectionPublisher
+            pub = DetectionPublisher()
+
+        payload = {"type": "detections", "vessels": [{"detection": {"x": 1.5, "track_id": None}, "vessel": None}]}
+        pub.publish("s1", payload)
+        pub.publish("s2", payload)
+
+        assert mock_redis.publish.call_args_list[0].args == (detections_channel("s1"), json.dumps(payload))
+        assert mock_redis.publish.call_args_list[1].args == (detections_channel("s2"), json.dumps(payload))
+
     def test_returns_true_on_success(self):
         mock_redis = MagicMock()
         with patch("cv.publisher.create_redis_client", return_value=mock_redis):
@@ -44,6 +57,41 @@ class TestPublishUnit:
 
         assert pub.publish("s1", {"type": "detections"}) is False
 
+    def test_publish_many_uses_one_pipeline(self):
+        mock_redis = MagicMock()
+        pipe = mock_redis.pipeline.return_value
+        with patch("cv.publisher.create_redis_client", return_value=mock_redis):
+            from cv.publisher import DetectionPublisher
+            pub = DetectionPublisher()
+
+        messages = [("s1", {"type": "detections", "frame_index": 1}), ("s2", {"type": "detections"})]
+        assert pub.publish_many(messages) is True
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert [c.args for c in pipe.publish.call_args_list] == [
+            (detections_channel(sid), json.dumps(payload)) for sid, payload in messages
+        ]
+        pipe.execute.assert_called_once()
+        mock_redis.publish.assert_not_called()
+
+    def test_publish_many_returns_false_on_redis_error(self):
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value.execute.side_effect = RedisError("connection refused")
+        with patch("cv.publisher.create_redis_client", return_value=mock_redis):
+            from cv.publisher import DetectionPublisher
+            pub = DetectionPublisher()
+
+        assert pub.publish_many([("s1", {"type": "detections"})]) is False
+
+    def test_publish_many_empty_is_noop(self):
+        mock_redis = MagicMock()
+        with patch("cv.publisher.create_redis_client", return_value=mock_redis):
+            from cv.publisher import DetectionPublisher
+            pub = DetectionPublisher()
+
+        assert pub.publish_many([]) is True
+        mock_redis.pipeline.assert_not_called()
+
     def test_close_calls_redis_close(self):
         mock_redis = MagicMock()
         with patch("cv.publisher.create_redis_client", return_value=mock_redis):
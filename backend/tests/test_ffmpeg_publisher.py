@@ -1,6 +1,7 @@
 """Tests for FFmpeg publisher — command construction, codec fallback, URL classification."""
 from __future__ import annotations
 
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,6 +9,7 @@ import pytest
 from cv.ffmpeg import (
     FFmpegDirectPublisher,
     _codec_order,
+    _probe_video_codec,
     _transcode_args,
 )
 
@@ -62,6 +64,55 @@ class TestTranscodeArgs:
         assert "zerolatency" in args
         assert "-g" in args
 
+    def test_libx264_without_low_latency(self, monkeypatch):
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_LOW_LATENCY", False)
+        args = _transcode_args("libx264")
+        assert "libx264" in args
+        assert "zerolatency" not in args
+        assert "-g" in args
+
+
+# ---------- _probe_video_codec ----------
+
+class TestProbeCache:
+    def test_successful_probe_is_cached(self, monkeypatch):
+        monkeypatch.setattr("cv.ffmpeg._probe_cache", {})
+        run = MagicMock(return_value="h264")
+        monkeypatch.setattr("cv.ffmpeg._run_ffprobe", run)
+        assert _probe_video_codec("rtsp://cam/a") == "h264"
+        assert _probe_video_codec("rtsp://cam/a") == "h264"
+        run.assert_called_once_with("rtsp://cam/a")
+
+    def test_failed_probe_is_retried(self, monkeypatch):
+        monkeypatch.setattr("cv.ffmpeg._probe_cache", {})
+        run = MagicMock(return_value=None)
+        monkeypatch.setattr("cv.ffmpeg._run_ffprobe", run)
+        assert _probe_video_codec("rtsp://cam/b") is None
+        assert _probe_video_codec("rtsp://cam/b") is None
+        assert run.call_count == 2
+
+    def test_lock_is_dropped_after_probe(self, monkeypatch):
+        monkeypatch.setattr("cv.ffmpeg._probe_cache", {})
+        locks: dict = {}
+        monkeypatch.setattr("cv.ffmpeg._probe_locks", locks)
+        monkeypatch.setattr("cv.ffmpeg._run_ffprobe", MagicMock(side_effect=["h264", None]))
+        assert _probe_video_codec("rtsp://cam/c") == "h264"
+        assert _probe_video_codec("rtsp://cam/d") is None
+        assert locks == {}
+
+    def test_replaced_local_file_is_probed_again(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("cv.ffmpeg._probe_cache", {})
+        run = MagicMock(side_effect=["h264", "hevc"])
+        monkeypatch.setattr("cv.ffmpeg._run_ffprobe", run)
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"a")
+        os.utime(video, ns=(1_000_000_000, 1_000_000_000))
+        assert _probe_video_codec(str(video)) == "h264"
+        assert _probe_video_codec(str(video)) == "h264"
+        os.utime(video, ns=(2_000_000_000, 2_000_000_000))
+        assert _probe_video_codec(str(video)) == "hevc"
+        assert run.call_count == 2
+
 
 # ---------- _build_command ----------
 
@@ -135,6 +186,37 @@ class TestBuildCommand:
         assert "1280" in cmd[vf_idx + 1]
         assert "720" in cmd[vf_idx + 1]
 
+    def test_hw_scaling_for_nvenc(self, monkeypatch):
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_BIN", "ffmpeg")
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_SCALE_WIDTH", 1280)
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_SCALE_HEIGHT", 720)
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_HW_SCALE", True)
+        pub = self._make_publisher(source_url="/data/video.mp4", loop=False)
+        cmd = pub._build_command(use_copy=False, transcode_codec="h264_nvenc")
+        assert cmd[cmd.index("-vf") + 1] == "scale_cuda=1280:720"
+        # hwaccel flags must precede the input
+        assert cmd.index("-hwaccel") < cmd.index("-i")
+
+    def test_hw_scaling_disabled_uses_cpu_scaler(self, monkeypatch):
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_BIN", "ffmpeg")
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_SCALE_WIDTH", 1280)
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_SCALE_HEIGHT", 720)
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_HW_SCALE", False)
+        pub = self._make_publisher(source_url="/data/video.mp4", loop=False)
+        cmd = pub._build_command(use_copy=False, transcode_codec="h264_nvenc")
+        assert "fast_bilinear" in cmd[cmd.index("-vf") + 1]
+        assert "-hwaccel" not in cmd
+
+    def test_hw_scaling_ignored_for_libx264(self, monkeypatch):
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_BIN", "ffmpeg")
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_SCALE_WIDTH", 1280)
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_SCALE_HEIGHT", 720)
+        monkeypatch.setattr("cv.ffmpeg.FFMPEG_HW_SCALE", True)
+        pub = self._make_publisher(source_url="/data/video.mp4", loop=False)
+        cmd = pub._build_command(use_copy=False, transcode_codec="libx264")
+        assert "fast_bilinear" in cmd[cmd.index("-vf") + 1]
+        assert "-hwaccel" not in cmd
+
     def test_no_scaling_in_copy_mode(self, monkeypatch):
         monkeypatch.setattr("cv.ffmpeg.FFMPEG_BIN", "ffmpeg")
         monkeypatch.setattr("cv.ffmpeg.FFMPEG_SCALE_WIDTH", 1280)
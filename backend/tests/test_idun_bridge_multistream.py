@@ -97,6 +97,31 @@ class FakeWorkerWebSocket:
         self.client_state = WebSocketState.DISCONNECTED
 
 
+class ProducingDecodeThread(StubDecodeThread):
+    """Yields a new frame on every read while ``producing`` is set."""
+
+    def __init__(self, stream_id: str):
+        super().__init__(stream_id, frame_index=0)
+        self.producing = True
+
+    def get_latest_telemetry(self) -> DecodedFrameTelemetry:
+        if self.producing:
+            self.advance_frame()
+        return super().get_latest_telemetry()
+
+
+class SlowSendWorkerWebSocket(FakeWorkerWebSocket):
+    def __init__(self, send_delay_s: float):
+        super().__init__()
+        self.send_delay_s = send_delay_s
+        self.sent_at: list[float] = []
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.sent_at.append(asyncio.get_running_loop().time())
+        await asyncio.sleep(self.send_delay_s)
+        await super().send_bytes(data)
+
+
 def _decode_frame_message(message: bytes) -> dict:
     header_len = struct.unpack(">I", message[:4])[0]
     return json.loads(message[4 : 4 + header_len])
@@ -206,6 +231,74 @@ def test_bridge_sender_announces_removed_stream_and_clears_pending_metrics():
     asyncio.run(run_test())
 
 
+def test_bridge_sender_interval_does_not_grow_with_send_duration(monkeypatch):
+    from cv.idun.bridge import IdunBridge
+
+    interval = 0.05
+    monkeypatch.setattr("cv.idun.bridge.IDUN_TARGET_SEND_FPS", 1.0 / interval)
+
+    async def run_test() -> None:
+        noop = NoopInferenceThread()
+        bridge = IdunBridge(noop, CapturingPublisher())
+        noop.register_stream("s1", ProducingDecodeThread("s1"))
+        noop.add_active_stream("s1")
+
+        # Each send takes 60% of the interval; sleeping a full interval after
+        # it would stretch the period to 1.6x.
+        websocket = SlowSendWorkerWebSocket(send_delay_s=interval * 0.6)
+        task = asyncio.create_task(bridge._sender_loop(websocket))
+        try:
+            await asyncio.sleep(interval * 8.5)
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        sent_at = websocket.sent_at
+        assert len(sent_at) >= 6
+        mean_gap = (sent_at[-1] - sent_at[0]) / (len(sent_at) - 1)
+        assert mean_gap == pytest.approx(interval, rel=0.25)
+
+    asyncio.run(run_test())
+
+
+def test_bridge_sender_reanchors_schedule_after_idle(monkeypatch):
+    from cv.idun.bridge import IdunBridge
+
+    interval = 0.05
+    monkeypatch.setattr("cv.idun.bridge.IDUN_TARGET_SEND_FPS", 1.0 / interval)
+
+    async def run_test() -> None:
+        noop = NoopInferenceThread()
+        bridge = IdunBridge(noop, CapturingPublisher())
+        decode_thread = ProducingDecodeThread("s1")
+        noop.register_stream("s1", decode_thread)
+        noop.add_active_stream("s1")
+
+        websocket = SlowSendWorkerWebSocket(send_delay_s=0.0)
+        task = asyncio.create_task(bridge._sender_loop(websocket))
+        try:
+            await asyncio.sleep(interval * 2.5)
+            # No new frames for several intervals, then resume.
+            decode_thread.producing = False
+            await asyncio.sleep(interval * 4)
+            resumed_from = len(websocket.sent_at)
+            decode_thread.producing = True
+            await asyncio.sleep(interval * 3.5)
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        resumed = websocket.sent_at[resumed_from:]
+        assert len(resumed) >= 3
+        # Without re-anchoring, the missed idle ticks would fire back to back.
+        gaps = [later - earlier for earlier, later in zip(resumed, resumed[1:])]
+        assert min(gaps) >= interval * 0.8
+
+    asyncio.run(run_test())
+
+
 def test_bridge_receiver_publishes_active_stream_detections_with_performance():
     from cv.idun.bridge import IdunBridge
 
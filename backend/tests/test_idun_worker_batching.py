@@ -43,6 +43,9 @@ class FakeDetection:
     def model_dump(self) -> dict:
         return dict(self._data)
 
+    def to_payload(self) -> dict:
+        return dict(self._data)
+
 
 class FakeDetector:
     def __init__(self, sleep_s: float = 0.0):
@@ -461,3 +464,18 @@ def test_inference_runs_predict_batch_not_detect():
     assert detector.batch_sizes[0] == 2
     assert len(detector.tracker_streams) >= 2
     assert set(detector.tracker_streams[:2]) == {"s1", "s2"}
+
+
+# ---------- Detection payload tests ----------
+
+def test_detection_to_payload_matches_model_dump():
+    from detectors import Detection
+
+    for detection in (
+        Detection(x=100.0, y=200.0, width=50.0, height=60.0, confidence=0.85),
+        Detection(
+            x=1.0, y=2.0, width=3.0, height=4.0, confidence=0.5,
+            class_id=1, class_name="ship", track_id=7,
+        ),
+    ):
+        assert detection.to_payload() == detection.model_dump()
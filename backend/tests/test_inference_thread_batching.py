@@ -5,6 +5,7 @@ import time
 from types import SimpleNamespace
 
 import numpy as np
+import pytest
 
 from cv.inference_thread import InferenceThread
 from cv.performance import DecodedFrameTelemetry, now_epoch_ms
@@ -26,6 +27,9 @@ class FakeDetection:
     def model_dump(self) -> dict:
         return dict(self._payload)
 
+    def to_payload(self) -> dict:
+        return dict(self._payload)
+
 
 class FakeTrackerRegistry:
     def update(self, stream_id: str, _results: object) -> list[FakeDetection]:
@@ -62,6 +66,11 @@ class CapturingPublisher:
         with self._lock:
             self.messages.append((stream_id, payload))
 
+    def publish_many(self, messages: list[tuple[str, dict]]) -> bool:
+        for stream_id, payload in messages:
+            self.publish(stream_id, payload)
+        return True
+
     def detection_messages(self) -> list[tuple[str, dict]]:
         with self._lock:
             return [item for item in self.messages if item[1].get("type") == "detections"]
@@ -309,3 +318,63 @@ def test_inference_thread_flushes_partial_batch_after_timeout(monkeypatch):
     assert detector.batch_sizes[0] == 1
     assert detections[0][0] == "stream-0"
     assert elapsed_s >= 0.025
+
+
+class SlowTrackerRegistry(FakeTrackerRegistry):
+    def __init__(self, sleep_s: float):
+        self.sleep_s = sleep_s
+
+    def update(self, stream_id: str, _results: object) -> list[FakeDetection]:
+        time.sleep(self.sleep_s)
+        return super().update(stream_id, _results)
+
+
+class TimestampingPublisher(CapturingPublisher):
+    def __init__(self):
+        super().__init__()
+        self.publish_many_called_at_ms: list[float] = []
+
+    def publish_many(self, messages: list[tuple[str, dict]]) -> bool:
+        self.publish_many_called_at_ms.append(now_epoch_ms())
+        return super().publish_many(messages)
+
+
+def test_frame_sent_at_is_stamped_once_just_before_publish(monkeypatch):
+    inference, _detector, _publisher = _build_inference_thread(monkeypatch, batch_size=3)
+    inference._tracker_registry = SlowTrackerRegistry(sleep_s=0.01)
+    publisher = TimestampingPublisher()
+    inference._publisher = publisher
+
+    for index in range(3):
+        stream_id = f"stream-{index}"
+        inference.register_stream(stream_id, FakeDecodeThread(frame_index=index))
+        inference.add_active_stream(stream_id)
+
+    inference.start()
+    try:
+        detections = publisher.wait_for_detections(expected_count=3, timeout_s=1.0)
+    finally:
+        inference.stop()
+
+    first_batch = detections[:3]
+    sent_at = {payload["frame_sent_at_ms"] for _stream_id, payload in first_batch}
+    assert len(sent_at) == 1
+    (frame_sent_at_ms,) = sent_at
+    assert frame_sent_at_ms <= publisher.publish_many_called_at_ms[0]
+
+    for _stream_id, payload in first_batch:
+        performance = payload["performance"]
+        assert performance["published_at_ms"] == pytest.approx(frame_sent_at_ms, abs=1e-3)
+        # Tracking all three streams (~30 ms) happens before the send stamp
+        assert performance["publish_duration_ms"] >= 25.0
+
+
+def test_inference_fps_is_smoothed_per_stream(monkeypatch):
+    inference, _detector, _publisher = _build_inference_thread(monkeypatch, batch_size=1)
+
+    assert inference._update_inference_fps("stream-0", 10.0) == 0.0
+    assert inference._update_inference_fps("stream-0", 10.1) == pytest.approx(10.0)
+    expected = 10.0 + InferenceThread.FPS_EMA_ALPHA * (20.0 - 10.0)
+    assert inference._update_inference_fps("stream-0", 10.15) == pytest.approx(expected)
+    # Other streams keep their own history
+    assert inference._update_inference_fps("stream-1", 10.15) == 0.0
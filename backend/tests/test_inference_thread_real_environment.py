@@ -35,6 +35,11 @@ class CapturingPublisher:
             self._messages.append((stream_id, payload))
         return True
 
+    def publish_many(self, messages: list[tuple[str, dict]]) -> bool:
+        for stream_id, payload in messages:
+            self.publish(stream_id, payload)
+        return True
+
     def detection_messages(self) -> list[tuple[str, dict]]:
         with self._lock:
             return [item for item in self._messages if item[1].get("type") == "detections"]
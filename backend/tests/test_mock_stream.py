@@ -0,0 +1,145 @@
+"""Tests for mock stream replay — CSV parsing and wire payload shape."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from common.types import Vessel
+from mock_stream import mock_stream
+
+
+@pytest.fixture(autouse=True)
+def _fresh_vessel_cache(monkeypatch):
+    monkeypatch.setattr(mock_stream, "_vessel_cache", {})
+
+
+def _row(line: str) -> dict:
+    (rows,) = mock_stream._load_by_second([line]).values()
+    return rows[0]
+
+
+ROW = _row("0,257000001,100,50,40,20,0.9")
+
+
+# ---------- _vessel_payload ----------
+
+class TestVesselPayload:
+    @pytest.mark.parametrize("with_ais", [True, False])
+    @pytest.mark.parametrize("line", ["0,257000001,100,50,40,20,0.9", "0,unknown,100,50,40,20,"])
+    def test_matches_pydantic_dump(self, monkeypatch, with_ais, line):
+        vessel = Vessel(mmsi="257000001", speed=3.5, heading=90.0) if with_ais else None
+        monkeypatch.setattr(mock_stream.ais_service, "build_vessel_from_ais", lambda mmsi: vessel)
+        row = _row(line)
+        assert mock_stream._vessel_payload(row) == mock_stream._build_vessel(row).model_dump()
+
+    def test_non_numeric_mmsi_has_no_track_id(self, monkeypatch):
+        monkeypatch.setattr(mock_stream.ais_service, "build_vessel_from_ais", lambda mmsi: None)
+        payload = mock_stream._vessel_payload(_row("0,unknown,100,50,40,20,0.9"))
+        assert payload["detection"]["track_id"] is None
+        assert payload["detection"]["x"] == 120.0
+        assert payload["detection"]["y"] == 60.0
+
+    def test_ais_lookup_cached_per_mmsi(self, monkeypatch):
+        calls = []
+
+        def _lookup(mmsi):
+            calls.append(mmsi)
+            return Vessel(mmsi=mmsi)
+
+        monkeypatch.setattr(mock_stream.ais_service, "build_vessel_from_ais", _lookup)
+        for _ in range(3):
+            mock_stream._vessel_payload(ROW)
+        mock_stream._build_vessel(ROW)
+        assert calls == ["257000001"]
+
+
+# ---------- _detections_message ----------
+
+class TestDetectionsMessage:
+    def _state(self):
+        return mock_stream.MockStreamState(
+            width=2560, height=1440, fps=25.0, start_second=0, duration=2, by_second={1: [ROW]},
+        )
+
+    def test_encodes_detections_for_second(self, monkeypatch):
+        monkeypatch.setattr(mock_stream.ais_service, "build_vessel_from_ais", lambda mmsi: None)
+        payload = json.loads(mock_stream._detections_message(self._state(), 1))
+        assert payload["type"] == "detections"
+        assert payload["frame_index"] == 25
+        assert payload["timestamp_ms"] == 1000
+        assert payload["vessels"] == [mock_stream._vessel_payload(ROW)]
+
+    def test_encoding_matches_send_json(self, monkeypatch):
+        vessel = Vessel(mmsi="257000001", name="Ærøy")
+        monkeypatch.setattr(mock_stream.ais_service, "build_vessel_from_ais", lambda mmsi: vessel)
+        message = mock_stream._detections_message(self._state(), 1)
+        assert message == json.dumps(json.loads(message), separators=(",", ":"), ensure_ascii=False)
+        assert "Ærøy" in message
+
+    def test_message_reused_per_second(self, monkeypatch):
+        monkeypatch.setattr(mock_stream.ais_service, "build_vessel_from_ais", lambda mmsi: None)
+        state = self._state()
+        first = mock_stream._detections_message(state, 1)
+        assert mock_stream._detections_message(state, 1) is first
+        assert json.loads(mock_stream._detections_message(state, 0))["vessels"] == []
+
+
+# ---------- MockStreamState ----------
+
+class TestMockStreamState:
+    def test_ready_message_matches_send_json(self):
+        state = mock_stream.MockStreamState(
+            width=2560, height=1440, fps=25.0, start_second=0, duration=1, by_second={},
+        )
+        assert state.ready_message == '{"type":"ready","width":2560,"height":1440,"fps":25.0}'
+
+
+# ---------- get_detections ----------
+
+class TestGetDetections:
+    def test_vessels_built_once_per_second(self, monkeypatch):
+        state = mock_stream.MockStreamState(
+            width=2560, height=1440, fps=25.0, start_second=5, duration=1, by_second={5: [ROW]},
+        )
+        monkeypatch.setattr(mock_stream, "_get_state", lambda: state)
+        monkeypatch.setattr(mock_stream.ais_service, "build_vessel_from_ais", lambda mmsi: None)
+        built = []
+        real_build = mock_stream._build_vessel
+        monkeypatch.setattr(mock_stream, "_build_vessel", lambda row: built.append(row) or real_build(row))
+
+        first = mock_stream.get_detections()
+        second = mock_stream.get_detections()
+        assert len(built) == 1
+        assert first is second
+        assert first[0].detection.track_id == 257000001
+
+
+# ---------- _load_by_second ----------
+
+class TestLoadBySecond:
+    def test_groups_rows_by_second(self):
+        lines = [
+            "0,257000001,100,50,40,20,0.9",
+            "0, 257000002 ,10,10,5,5,",
+            "1,257000001,102,50,40,20,0.8",
+        ]
+        by_second = mock_stream._load_by_second(lines)
+        assert sorted(by_second) == [0, 1]
+        assert [r["mmsi"] for r in by_second[0]] == ["257000001", "257000002"]
+        assert by_second[0][1]["confidence"] == 1.0  # empty confidence defaults to 1.0
+        assert by_second[1][0]["x"] == 122.0
+
+    def test_skips_blank_short_and_malformed_rows(self):
+        lines = ["", "   ", "0,1,2", "x,257000001,1,1,1,1,1", "2.0,257000003,1,2,3,4,0.5"]
+        by_second = mock_stream._load_by_second(lines)
+        assert list(by_second) == [2]
+        assert by_second[2][0] == {
+            "mmsi": "257000003", "x": 2.5, "y": 4.0, "width": 3.0, "height": 4.0,
+            "confidence": 0.5, "track_id": 257000003,
+        }
+
+    def test_mmsi_normalized_at_load(self):
+        (row,) = mock_stream._load_by_second(["0,257000001.0,0,0,2,2,1"])[0]
+        assert row["mmsi"] == "257000001"
+        assert row["track_id"] == 257000001
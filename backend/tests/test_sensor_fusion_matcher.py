@@ -0,0 +1,81 @@
+"""Tests for the AIS ↔ detection matcher — greedy nearest-neighbour assignment."""
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from sensor_fusion.matcher import match_detections_to_ais
+
+
+def _det(x: float, y: float, track_id: int | None = None) -> dict:
+    return {"x": x, "y": y, "width": 20.0, "height": 10.0, "confidence": 0.8, "track_id": track_id}
+
+
+def _ais(mmsi: int, x_px: float, y_px: float) -> dict:
+    return {
+        "mmsi": mmsi,
+        "speedOverGround": 5.0,
+        "trueHeading": 90,
+        "projection": {"x_px": x_px, "y_px": y_px, "distance_m": 500.0, "rel_bearing_deg": 1.0},
+    }
+
+
+def _reference_pairs(dets: list[dict], ais: list[dict], max_distance_px: float) -> list[tuple[str, int]]:
+    """Pair-by-pair greedy matcher — the behaviour the vectorized version must keep."""
+    pairs = []
+    for ai, rec in enumerate(ais):
+        for di, det in enumerate(dets):
+            dist = math.hypot(det["x"] - rec["projection"]["x_px"], det["y"] - rec["projection"]["y_px"])
+            if dist <= max_distance_px:
+                pairs.append((dist, ai, di))
+    pairs.sort(key=lambda p: p[0])
+    used_ais, used_det, result = set(), set(), []
+    for _, ai, di in pairs:
+        if ai in used_ais or di in used_det:
+            continue
+        used_ais.add(ai)
+        used_det.add(di)
+        result.append((str(ais[ai]["mmsi"]), dets[di]["track_id"]))
+    return result
+
+
+# ---------- match_detections_to_ais ----------
+
+class TestMatcher:
+    def test_closest_pair_wins(self):
+        dets = [_det(100, 100, track_id=1), _det(110, 100, track_id=2)]
+        ais = [_ais(111, 108, 100)]
+        fused = match_detections_to_ais(dets, ais, max_distance_px=50)
+        matched = [v for v in fused if v["vessel"] is not None]
+        assert len(matched) == 1
+        assert matched[0]["detection"]["track_id"] == 2
+        assert matched[0]["fusion"]["match_distance_px"] == 2.0
+        # The other detection is still emitted, unmatched
+        assert [v["detection"]["track_id"] for v in fused if v["vessel"] is None] == [1]
+
+    def test_out_of_range_not_matched(self):
+        fused = match_detections_to_ais([_det(0, 0)], [_ais(111, 500, 500)], max_distance_px=50)
+        assert fused == [{"detection": fused[0]["detection"], "vessel": None}]
+
+    def test_unmatched_ais_included_on_request(self):
+        fused = match_detections_to_ais(
+            [_det(0, 0)], [_ais(111, 500, 500)], include_unmatched_ais=True, max_distance_px=50,
+        )
+        assert any(v["detection"] is None and v["vessel"]["mmsi"] == "111" for v in fused)
+
+    def test_ais_without_projection_ignored(self):
+        ais = [{"mmsi": 111, "projection": None}]
+        fused = match_detections_to_ais([_det(0, 0)], ais, include_unmatched_ais=True)
+        assert len(fused) == 1
+        assert fused[0]["vessel"] is None
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_pairwise_reference(self, seed):
+        rng = random.Random(seed)
+        dets = [_det(rng.uniform(0, 400), rng.uniform(0, 200), track_id=i) for i in range(15)]
+        ais = [_ais(1000 + i, rng.uniform(0, 400), rng.uniform(0, 200)) for i in range(10)]
+        fused = match_detections_to_ais(dets, ais, max_distance_px=60)
+        got = [(v["vessel"]["mmsi"], v["detection"]["track_id"]) for v in fused if v["vessel"] is not None]
+        assert got == _reference_pairs(dets, ais, 60)
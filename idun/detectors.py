@@ -39,6 +39,19 @@ class Detection(BaseModel):
     class_name: str | None = "boat"
     track_id: int | None = None
 
+    def to_payload(self) -> dict:
+        """Same dict as ``model_dump()``, built directly for per-frame payloads."""
+        return {
+            "x": self.x,
+            "y": self.y,
+            "width": self.width,
+            "height": self.height,
+            "confidence": self.confidence,
+            "class_id": self.class_id,
+            "class_name": self.class_name,
+            "track_id": self.track_id,
+        }
+
 
 class _TrackerArgs:
     """Namespace matching what BYTETracker expects from its args parameter."""
@@ -365,7 +365,7 @@ async def _inference_task(
 
             vessels = [
                 {
-                    "detection": d.model_dump(),
+                    "detection": d.to_payload(),
                     "vessel": None,
                 }
                 for d in tracked_detections